@@ -3,10 +3,20 @@ from __future__ import annotations
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from typing import List, Dict, Any
+from functools import lru_cache
 import json
+import os
 
 ROOT = Path(__file__).resolve().parents[1]
 
+
+@lru_cache(maxsize=8)
+def _read_cfg_text(path_str: str, mtime_ns: int, size: int) -> str:
+    # mtime_ns and size are part of the key so edits to the file invalidate the entry
+    with open(path_str, "r", encoding="utf-8") as f:
+        return f.read()
+
+
 @dataclass
 class DataCfg:
     spam_dir: str = str(ROOT / "data" / "spam")
@@ -144,8 +154,10 @@ class ProjectConfig:
     # ---- JSON IO ----
     @classmethod
     def from_json(cls, path: str | Path) -> "ProjectConfig":
-        with open(path, "r", encoding="utf-8") as f:
-            cfg = json.load(f)
+        path_str = os.fspath(path)
+        st = os.stat(path_str)
+        # only the text is cached; json.loads gives every caller a fresh dict
+        cfg = json.loads(_read_cfg_text(path_str, st.st_mtime_ns, st.st_size))
         return cls._from_dict(cfg)
 
     def to_json(self, path: str | Path) -> None:
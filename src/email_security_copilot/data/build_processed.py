@@ -4,6 +4,17 @@ import argparse
 from email_security_copilot.data.data import load_data
 from email_security_copilot.features.features import EmailFeatureClass
 
+try:
+    import pyarrow as pa  # optional dep, multithreaded C++ CSV writer
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+try:
+    import polars as pl  # optional dep, multithreaded feature engineering
+except ImportError:
+    pl = None
+
 
 def main() -> None:
     ap = argparse.ArgumentParser()
@@ -30,7 +41,12 @@ def main() -> None:
 
     df = load_data(spam_dir=str(spam_dir), ham_dir=str(ham_dir))
     
-    features_df = EmailFeatureClass()(df)
+    fe = EmailFeatureClass()
+    if pl is not None and pa is not None:
+        # polars <-> pandas conversion goes through Arrow, so both are needed
+        features_df = fe.transform_polars(pl.from_pandas(df)).to_pandas()
+    else:
+        features_df = fe(df)
     # sanity: keep only expected columns (and order them nicely)
     keep = ['sender', 'recipient', 'num_cc', 'subject', 'content', 
         'subject_len', 'content_len', 'has_link', 'num_hops', 'label']
@@ -47,7 +63,15 @@ def main() -> None:
     raw_df["subject"] = raw_df["subject"].fillna("").astype(str)
     raw_df["content"] = raw_df["content"].fillna("").astype(str)
 
-    raw_df.to_csv(out_path, index=False)
+    if pa is not None:
+        pacsv.write_csv(
+            pa.Table.from_pandas(raw_df, preserve_index=False),
+            str(out_path),
+            # explicit, so quoting does not depend on the installed pyarrow's default
+            write_options=pacsv.WriteOptions(quoting_style="needed"),
+        )
+    else:
+        raw_df.to_csv(out_path, index=False)
     print(f"Wrote {len(raw_df):,} rows -> {out_path}")
     print(raw_df["label"].value_counts(dropna=False))
 
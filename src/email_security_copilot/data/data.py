@@ -1,101 +1,125 @@
 from __future__ import annotations
-import os, re, pandas as pd
+import html, os, re, pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from email import policy
 from email.parser import BytesParser
 from email.utils import getaddresses
 
+# Stateless after construction with policy.default; one per (worker) process.
+_PARSER = BytesParser(policy=policy.default)
+
+
+# Body extraction helpers live at module scope so they pickle cheaply
+# into the worker processes used by EmailDataset.load.
+
+def _dec(part):
+    b = part.get_payload(decode=True)
+    if b is None:
+        return (part.get_payload() or "").encode("utf-8", "ignore")
+    return b
+
+def _txt(part):
+    cs = (part.get_content_charset() or "").strip().strip('"').lower() or "utf-8"
+    try:
+        return _dec(part).decode(cs, "replace")
+    except Exception:
+        return _dec(part).decode("latin-1", "replace")
+
+def _html2txt(s: str) -> str:
+    if "<" not in s:  # advertised as HTML but has no markup
+        return re.sub(r"\s+\n", "\n", html.unescape(s)).strip()
+    s = re.sub(r"(?is)<(script|style).*?>.*?</\1>", "", s)
+    s = re.sub(r"(?is)<br\s*/?>|</p>", "\n", s)
+    s = re.sub(r"(?is)<.*?>", "", s)
+    return re.sub(r"\s+\n", "\n", html.unescape(s)).strip()
+
+def _get_body(msg) -> str:
+    if msg.is_multipart():
+        # single walk: first text/plain wins, first text/html is the fallback
+        html_part = None
+        for p in msg.walk():
+            ct = p.get_content_type()
+            if ct == "text/plain":
+                return _txt(p)
+            if ct == "text/html" and html_part is None:
+                html_part = p
+        return _html2txt(_txt(html_part)) if html_part is not None else ""
+    else:
+        ct = msg.get_content_type()
+        if ct == "text/plain": return _txt(msg)
+        if ct == "text/html":  return _html2txt(_txt(msg))
+        return ""
+
+def _parse_one(path: str, label: str | None) -> dict | None:
+    """Parse a single email file into a row dict; None if it should be skipped."""
+    try:
+        # raw fd read: skips the buffered file object for many tiny files
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            raw = os.read(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+        msg = _PARSER.parsebytes(raw)
+    except Exception:
+        return None
+
+    # str(): header objects pickle back to the parent far larger and slower
+    subj   = str(msg.get("Subject", "") or "")
+    sender = str(msg.get("From", "") or "")
+    to     = str(msg.get("To", "") or "")
+    recvd  = msg.get_all("Received", []) or []
+
+    cc_hdrs  = msg.get_all("Cc", []) or []
+    cc_addrs = [addr for _name, addr in getaddresses(cc_hdrs)]
+    num_cc   = sum(1 for a in cc_addrs if a)
+
+    try:
+        content = _get_body(msg)
+    except Exception:
+        return None
+
+    if not (subj or content or sender):
+        return None
+
+    row = {
+        "file": os.path.basename(path),
+        "sender": sender,
+        "recipient": to,
+        "num_cc": num_cc,
+        "subject": subj,
+        "content": content,
+        "num_hops": len(recvd),
+    }
+    if label is not None:
+        row["label"] = label
+    return row
+
+
 class EmailDataset:
     """Loads one directory of emails into a DataFrame (text + metadata)."""
 
-    def __init__(self, dir_path: str, label: str | None = None):
+    def __init__(self, dir_path: str, label: str | None = None,
+                 max_workers: int | None = None):
         self.dir_path = dir_path
         self.label = label
+        self.max_workers = max_workers  # None -> os.cpu_count()
 
-    @staticmethod
-    def _dec(part):
-        b = part.get_payload(decode=True)
-        if b is None:
-            return (part.get_payload() or "").encode("utf-8", "ignore")
-        return b
+    def load(self) -> pd.DataFrame:
+        paths = [e.path for e in os.scandir(self.dir_path) if e.is_file()]
+        if not paths:
+            return pd.DataFrame([])
 
-    @staticmethod
-    def _txt(part):
-        cs = (part.get_content_charset() or "").strip().strip('"').lower() or "utf-8"
-        try:
-            return EmailDataset._dec(part).decode(cs, "replace")
-        except Exception:
-            return EmailDataset._dec(part).decode("latin-1", "replace")
-
-    @staticmethod
-    def _html2txt(s: str) -> str:
-        s = re.sub(r"(?is)<(script|style).*?>.*?</\1>", "", s)
-        s = re.sub(r"(?is)<br\s*/?>|</p>", "\n", s)
-        s = re.sub(r"(?is)<.*?>", "", s)
-        return re.sub(r"\s+\n", "\n", s).strip()
-
-    @classmethod
-    def _get_body(cls, msg) -> str:
-        if msg.is_multipart():
-            for p in msg.walk():
-                if p.get_content_type() == "text/plain":
-                    return cls._txt(p)
-            for p in msg.walk():
-                if p.get_content_type() == "text/html":
-                    return cls._html2txt(cls._txt(p))
-            return ""
+        workers = self.max_workers or os.cpu_count() or 1
+        if workers == 1:
+            # a pool only adds process start-up and pickling with one worker
+            results = [_parse_one(p, self.label) for p in paths]
         else:
-            ct = msg.get_content_type()
-            if ct == "text/plain": return cls._txt(msg)
-            if ct == "text/html":  return cls._html2txt(cls._txt(msg))
-            return ""
-
-    def load(self) -> pd.DataFrame:
-        rows, skipped = [], 0
-        for e in os.scandir(self.dir_path):
-            if not e.is_file():
-                continue
-            try:
-                with open(e.path, "rb") as fh:
-                    raw = fh.read()
-                msg = BytesParser(policy=policy.default).parsebytes(raw)
-            except Exception:
-                skipped += 1
-                continue
-
-            subj   = msg.get("Subject", "") or ""
-            sender = msg.get("From", "") or ""
-            to     = msg.get("To", "") or ""
-            recvd  = msg.get_all("Received", []) or []
-
-            cc_hdrs  = msg.get_all("Cc", []) or []
-            cc_addrs = [addr for _name, addr in getaddresses(cc_hdrs)]
-            num_cc   = sum(1 for a in cc_addrs if a)
-            cc_txt   = ", ".join(a for a in cc_addrs if a)
-
-            try:
-                content = self._get_body(msg)
-            except Exception:
-                skipped += 1
-                continue
-
-            if not (subj or content or sender):
-                skipped += 1
-                continue
-
-            row = {
-                "file": e.name,
-                "sender": sender,
-                "recipient": to,
-                "cc": cc_txt,
-                "num_cc": num_cc,
-                "subject": subj,
-                "content": content,
-                "num_hops": len(recvd),
-            }
-            if self.label is not None:
-                row["label"] = self.label
-            rows.append(row)
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                results = list(ex.map(_parse_one, paths,
+                                      [self.label] * len(paths), chunksize=64))
 
+        rows = [r for r in results if r is not None]
+        skipped = len(results) - len(rows)
         if skipped:
             print(f"[EmailDataset] skipped {skipped} files in {self.dir_path}")
         return pd.DataFrame(rows)
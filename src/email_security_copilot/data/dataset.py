@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Any, Dict
+import os
 import torch
 from torch.utils.data import Dataset
-from transformers import AutoTokenizer
+from transformers import AutoTokenizer, DataCollatorWithPadding
 
 from src.email_security_copilot.config import ProjectConfig
 from src.email_security_copilot.data.data import load_data
+from src.email_security_copilot.data.textPreprocessor import TextPreprocessor
 import pandas as pd
 
+LABEL_MAP = {"ham": 0, "spam": 1}
+
 
 class SpamFrameDataset(Dataset):
     """
@@ -16,35 +20,117 @@ class SpamFrameDataset(Dataset):
     """
 
     def __init__(self,  df: pd.DataFrame, cfg: ProjectConfig):
-        self.df = df.reset_index(drop=True)
+        df = df.reset_index(drop=True)
         self.cfg = cfg
         self.data_cfg = cfg.data
         self.tokenizer = AutoTokenizer.from_pretrained(
             cfg.model.pretrained_model_name
         )
-        self.label_map = {"ham": 0, "spam": 1}
+        self.label_map = LABEL_MAP
+
+        # Tokenize the whole column once up front, unpadded; padding happens
+        # per batch in collate_fn so batches only grow to their longest item.
+        enc = self.tokenizer(
+            df[cfg.model.text_col].tolist(),
+            truncation=True,
+            max_length=self.data_cfg.max_length,
+        )
+        # Token ids/masks of all samples concatenated into flat contiguous
+        # tensors; sample i spans offsets[i]:offsets[i + 1]. __getitem__ returns
+        # views, and the DataFrame itself is not kept.
+        lengths = torch.tensor([len(x) for x in enc["input_ids"]], dtype=torch.long)
+        self.offsets = torch.zeros(len(lengths) + 1, dtype=torch.long)
+        torch.cumsum(lengths, dim=0, out=self.offsets[1:])
+        self.input_ids = torch.tensor(
+            [t for x in enc["input_ids"] for t in x], dtype=torch.long
+        )
+        self.attention_mask = torch.tensor(
+            [t for x in enc["attention_mask"] for t in x], dtype=torch.long
+        )
+
+        labels = df[self.data_cfg.label_col].map(self.label_map)
+        if labels.isna().any():
+            unknown = sorted(set(df.loc[labels.isna(), self.data_cfg.label_col]), key=repr)
+            raise ValueError(f"Unknown labels: {unknown}")
+        self.labels = torch.tensor(labels.to_numpy(dtype="int64"), dtype=torch.long)
+
+        # Pass as DataLoader(..., collate_fn=dataset.collate_fn);
+        # multiples of 8 keep shapes aligned for tensor cores.
+        self.collate_fn = DataCollatorWithPadding(self.tokenizer, pad_to_multiple_of=8)
 
     def __len__(self) -> int:
-        return len(self.df)
+        return len(self.labels)
 
     def __getitem__(self, idx: int) -> Dict[str, torch.Tensor]:
-        row = self.df.iloc[idx]
+        idx = range(len(self))[idx]  # negative indices; IndexError when out of range
+        start, end = self.offsets[idx].item(), self.offsets[idx + 1].item()
+        return {
+            "input_ids": self.input_ids[start:end],
+            "attention_mask": self.attention_mask[start:end],
+            "labels": self.labels[idx],
+        }
 
-        text = row[self.cfg.model.text_col]
-        label_str = row[self.data_cfg.label_col]
-        label = self.label_map[label_str]
 
-        encoding = self.tokenizer(
-            text,
-            truncation=True,
-            padding="max_length",
-            max_length=self.data_cfg.max_length,
-            return_tensors="pt",
+# -----------------------------
+# Hugging Face datasets pipeline
+# -----------------------------
+
+def preprocess(batch: dict[str, list[Any]], preprocessor: TextPreprocessor,
+               subject_col: str, content_col: str, out_col: str) -> dict[str, list[str]]:
+    texts = [
+        f"{subj or ''}\n{cont or ''}".strip()
+        for subj, cont in zip(batch[subject_col], batch[content_col], strict=True)
+    ]
+    return {out_col: [preprocessor(t) for t in texts]}
+
+
+def tokenize(batch: dict[str, list[Any]], tokenizer, text_col: str, label_col: str,
+             max_length: int) -> dict[str, list[Any]]:
+    enc = tokenizer(batch[text_col], truncation=True, max_length=max_length)
+    labels = [LABEL_MAP.get(label) for label in batch[label_col]]
+    if None in labels:
+        unknown = sorted(
+            {lab for lab, v in zip(batch[label_col], labels, strict=True) if v is None},
+            key=repr,
         )
+        raise ValueError(f"Unknown labels: {unknown}")
+    enc["labels"] = labels
+    return enc
 
-        item = {
-            "input_ids": encoding["input_ids"].squeeze(0),
-            "attention_mask": encoding["attention_mask"].squeeze(0),
-            "labels": torch.tensor(label, dtype=torch.long),
-        }
-        return item
+
+def build_hf_dataset(df: pd.DataFrame, cfg: ProjectConfig, num_proc: int | None = None,
+                     subject_col: str = "subject"):
+    """
+    Arrow-backed alternative to SpamFrameDataset: joins subject_col and
+    cfg.data.text_col (subject line, then body) and cleans the result into
+    cfg.model.text_col across num_proc workers, then tokenizes (unpadded, use
+    DataCollatorWithPadding). The dataset is built in memory from the DataFrame,
+    so nothing is cached between runs; use save_to_disk to keep the result.
+    """
+    import datasets  # optional dep
+
+    tokenizer = AutoTokenizer.from_pretrained(cfg.model.pretrained_model_name)
+    ds = datasets.Dataset.from_pandas(df.reset_index(drop=True), preserve_index=False)
+    ds = ds.map(
+        preprocess,
+        batched=True,
+        num_proc=num_proc or os.cpu_count(),
+        fn_kwargs={
+            "preprocessor": TextPreprocessor(cfg),
+            "subject_col": subject_col,
+            "content_col": cfg.data.text_col,
+            "out_col": cfg.model.text_col,
+        },
+    )
+    ds = ds.map(
+        tokenize,
+        batched=True,
+        fn_kwargs={
+            "tokenizer": tokenizer,
+            "text_col": cfg.model.text_col,
+            "label_col": cfg.data.label_col,
+            "max_length": cfg.data.max_length,
+        },
+    )
+    ds.set_format("torch", columns=["input_ids", "attention_mask", "labels"])
+    return ds
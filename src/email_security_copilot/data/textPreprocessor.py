@@ -1,9 +1,33 @@
 from __future__ import annotations
 import re, numpy as np, pandas as pd
 import html
-from dataclasses import dataclass
+import os
 import sys
 import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def _punct_re() -> re.Pattern:
+    """Unicode punctuation (categories P*) as one character class, built on first use."""
+    chars = "".join(
+        chr(i) for i in range(sys.maxunicode + 1) if unicodedata.category(chr(i)).startswith("P")
+    )
+    return re.compile(f"[{re.escape(chars)}]+")
+
+
+@lru_cache(maxsize=4)
+def _get_nlp(lang: str):
+    """Load a spaCy model once per process; None if it is not installed."""
+    import spacy  # optional dep
+
+    model = {"en": "en_core_web_sm"}.get(lang, "en_core_web_sm")
+    try:
+        # tok2vec/tagger stay enabled: the rule-based lemmatizer needs POS tags
+        return spacy.load(model, disable=["parser", "ner"])
+    except OSError:
+        return None
 
 
 @dataclass
@@ -16,28 +40,56 @@ class TextPreprocessor:
     HASHTAG_RE = re.compile(r"#\w+")
     HTML_TAG_RE = re.compile(r"<[^>]+>")
     DIGIT_RE = re.compile(r"\d+")
-    PUNCT_TABLE = dict.fromkeys(
-        i for i in range(sys.maxunicode) if unicodedata.category(chr(i)).startswith("P")
-    )
+    _WS_RE = re.compile(r"\s+")
 
     def __init__(self, cfg):
         self.cfg = cfg
-        self._nlp = None  # lazy-load spaCy if lemmatize=true
+
+        # URL/email/handle/hashtag removals fused into one alternation so the
+        # text is scanned once; HTML stays separate since it runs right after unescape.
+        # Leftmost match wins, so adjacent tokens can differ from the old sequential
+        # passes: "foo@bar.comhttp://x" with urls+emails now leaves "://x".
+        pp = cfg.preprocessing
+        enabled = [
+            regex.pattern
+            for flag, regex in (
+                (pp.remove_urls, self.URL_RE),
+                (pp.remove_emails, self.EMAIL_RE),
+                (pp.remove_user_handles, self.HANDLE_RE),
+                (pp.remove_hashtags, self.HASHTAG_RE),
+            )
+            if flag
+        ]
+        self._fused = re.compile("|".join(f"(?:{p})" for p in enabled)) if enabled else None
+
+        # Regex removals for transform_series, in the same order as __call__
+        self._ops = []
+        if pp.remove_html:
+            self._ops.append((self.HTML_TAG_RE, " "))
+        if self._fused is not None:
+            self._ops.append((self._fused, " "))
 
     def _lemmatize(self, text: str) -> str:
-        if self._nlp is None:
-            import spacy  # optional dep
-
-            lang = self.cfg.preprocessing.language
-            model = {"en": "en_core_web_sm"}.get(lang, "en_core_web_sm")
-            try:
-                self._nlp = spacy.load(model)
-            except OSError:
-                # If model not installed, skip lemmatization gracefully
-                return text
-        doc = self._nlp(text)
+        # One doc at a time; prefer lemmatize_series for whole columns.
+        nlp = _get_nlp(self.cfg.preprocessing.language)
+        if nlp is None:
+            # If model not installed, skip lemmatization gracefully
+            return text
+        doc = nlp(text)
         return " ".join(tok.lemma_ for tok in doc)
 
+    def lemmatize_series(self, s: pd.Series, batch_size: int = 256,
+                         n_process: int | None = None) -> pd.Series:
+        nlp = _get_nlp(self.cfg.preprocessing.language)
+        if nlp is None:
+            return s
+        docs = nlp.pipe(s.tolist(), batch_size=batch_size,
+                        n_process=n_process or os.cpu_count() or 1)
+        return pd.Series(
+            [" ".join(tok.lemma_ for tok in doc) for doc in docs],
+            index=s.index, dtype=object,
+        )
+
     def __call__(self, text: str) -> str:
         if not self.cfg.preprocessing.enable:
             return text
@@ -45,33 +97,51 @@ class TextPreprocessor:
         # Unescape HTML entities and optionally remove tags
         text = html.unescape(text)
         if self.cfg.preprocessing.remove_html:
-            text = re.sub(self.HTML_TAG_RE, " ", text)
+            text = self.HTML_TAG_RE.sub(" ", text)
 
-        if self.cfg.preprocessing.remove_urls:
-            text = re.sub(self.URL_RE, " ", text)
-
-        if self.cfg.preprocessing.remove_emails:
-            text = re.sub(self.EMAIL_RE, " ", text)
-
-        if self.cfg.preprocessing.remove_user_handles:
-            text = re.sub(self.HANDLE_RE, " ", text)
-
-        if self.cfg.preprocessing.remove_hashtags:
-            text = re.sub(self.HASHTAG_RE, " ", text)
+        if self._fused is not None:
+            text = self._fused.sub(" ", text)
 
         if self.cfg.preprocessing.lowercase:
             text = text.lower()
 
         if self.cfg.preprocessing.remove_digits:
-            text = re.sub(self.DIGIT_RE, " ", text)
+            text = self.DIGIT_RE.sub(" ", text)
 
         if self.cfg.preprocessing.remove_punctuation:
-            text = text.translate(self.PUNCT_TABLE)
+            text = _punct_re().sub("", text)
 
         if self.cfg.preprocessing.collapse_whitespace:
-            text = re.sub(r"\s+", " ", text).strip()
+            text = self._WS_RE.sub(" ", text).strip()
 
         if self.cfg.preprocessing.lemmatize:
             text = self._lemmatize(text)
 
         return text
+
+    def transform_series(self, s: pd.Series) -> pd.Series:
+        """Batch version of __call__ over a whole text column."""
+        if not self.cfg.preprocessing.enable:
+            return s
+
+        pp = self.cfg.preprocessing
+        s = s.fillna("").astype(str).map(html.unescape)
+        for pattern, repl in self._ops:
+            s = s.str.replace(pattern, repl, regex=True)
+
+        if pp.lowercase:
+            s = s.str.lower()
+
+        if pp.remove_digits:
+            s = s.str.replace(self.DIGIT_RE, " ", regex=True)
+
+        if pp.remove_punctuation:
+            s = s.str.replace(_punct_re(), "", regex=True)
+
+        if pp.collapse_whitespace:
+            s = s.str.replace(self._WS_RE, " ", regex=True).str.strip()
+
+        if pp.lemmatize:
+            s = self.lemmatize_series(s)
+
+        return s
@@ -1,8 +1,14 @@
 from __future__ import annotations
+import numpy as np
 import pandas as pd
 from dataclasses import dataclass
 import re
 
+try:
+    import polars as pl  # optional dep
+except ImportError:
+    pl = None
+
 
 @dataclass
 class EmailFeatureClass:
@@ -18,7 +24,7 @@ class EmailFeatureClass:
 
     def __call__(self, df: pd.DataFrame) -> pd.DataFrame:
         
-        df = df.copy()
+        df = df.copy(deep=False)  # only adds columns
         if "subject_len" not in df.columns and self.subject_col in df.columns:
             df["subject_len"] = df[self.subject_col].fillna("").str.len()
 
@@ -28,15 +34,56 @@ class EmailFeatureClass:
         if "has_link" not in df.columns:
             subj = df[self.subject_col].fillna("").astype(str)
             cont = df[self.content_col].fillna("").astype(str)
-            df["has_link"] = (subj + " " + cont).str.contains(self.URL_RE).astype(int)
+            df["has_link"] = (
+                subj.str.contains(self.URL_RE) | cont.str.contains(self.URL_RE)
+            ).astype(int)
 
+        # load() already emits num_cc; recomputing from a "cc" string is a fallback
         if "num_cc" not in df.columns and "cc" in df.columns:
-            df["num_cc"] = df["cc"].fillna("").apply(
-                lambda x: len([a.strip() for a in x.split(", ") if a.strip()])
+            cc = df["cc"].fillna("").astype(str).str.strip()
+            df["num_cc"] = np.where(cc.str.len().gt(0), cc.str.count(r",\s*") + 1, 0)
+
+        missing = [c for c in self.cols if c not in df.columns]
+        if missing:
+            raise ValueError(f"Missing expected columns: {missing}")
+
+        return df
+
+    def transform_polars(self, df: pl.DataFrame) -> pl.DataFrame:
+        """Polars version of __call__; all features built in one with_columns."""
+        if pl is None:
+            raise ImportError("transform_polars requires polars to be installed.")
+
+        subj = pl.col(self.subject_col).fill_null("").cast(pl.Utf8)
+        cont = pl.col(self.content_col).fill_null("").cast(pl.Utf8)
+        exprs = []
+        if "subject_len" not in df.columns and self.subject_col in df.columns:
+            exprs.append(subj.str.len_chars().cast(pl.Int64).alias("subject_len"))
+
+        if "content_len" not in df.columns and self.content_col in df.columns:
+            exprs.append(cont.str.len_chars().cast(pl.Int64).alias("content_len"))
+
+        if "has_link" not in df.columns:
+            url = self.URL_RE.pattern
+            exprs.append(
+                (subj.str.contains(url) | cont.str.contains(url)).cast(pl.Int64).alias("has_link")
             )
 
+        if "num_cc" not in df.columns and "cc" in df.columns:
+            cc = pl.col("cc").fill_null("").cast(pl.Utf8).str.strip_chars()
+            exprs.append(
+                pl.when(cc.str.len_chars() > 0)
+                .then(cc.str.count_matches(r",\s*") + 1)
+                .otherwise(0)
+                .cast(pl.Int64)
+                .alias("num_cc")
+            )
+
+        if exprs:
+            df = df.with_columns(exprs)
+
         missing = [c for c in self.cols if c not in df.columns]
         if missing:
             raise ValueError(f"Missing expected columns: {missing}")
 
-        return df.copy()
+        return df